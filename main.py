@@ -1,7 +1,30 @@
+import asyncio
+import sys
+import warnings
+
 from lagom import Container
 from bot import MyDiscordClient, bootstrap
 
+
+def _install_event_loop_policy() -> None:
+    """설치되어 있다면 uvloop(윈도우에서는 winloop) 이벤트 루프를 사용합니다."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    # 이벤트 루프 정책은 Python 3.14부터 deprecated 되었지만(3.16에서 제거 예정),
+    # Client.run()은 루프 팩토리를 받지 않고 asyncio.run()은 아직 정책을 따르므로
+    # 해당 DeprecationWarning만 무시합니다.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_event_loop_policy()
     container: Container = bootstrap()
     client: MyDiscordClient = container[MyDiscordClient]
     client.run(root_logger=True)
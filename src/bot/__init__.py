@@ -1,18 +1,15 @@
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Protocol
+from functools import partial
+from typing import Any, Awaitable, Callable
 
 from discord import Client, Intents, Message, MessageType
+from discord.abc import Messageable
 from discord.utils import MISSING
 from expression.collections import Block
-from lagom import Container, Singleton
+from lagom import Container
 from lagom.environment import Env
-from returns.context import ReaderFutureResult, ReaderIOResult
-from returns.converters import maybe_to_result
-from returns.future import Future, FutureResult
-from returns.io import IO, IOResult, IOSuccess
-from returns.maybe import Maybe, Nothing, Some
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -21,10 +18,6 @@ class MyDiscordClientEnvironment(Env):
     discord_token: str
 
 
-class _DbConnection(Protocol):
-    session: str
-
-
 @dataclass(frozen=True)
 class Deletion:
     server_id: int
@@ -38,107 +31,179 @@ _repo: list[Deletion] = [
     ),
     Deletion(server_id=910708305247211520, template_message="야호"),
 ]
+_deletions_by_guild: dict[int, Deletion] = {d.server_id: d for d in _repo}
+_target_guild_ids: frozenset[int] = frozenset(_deletions_by_guild)
+
+
+class AlertBatcher:
+    """채널별 경고 메시지를 짧은 시간 동안 모았다가 하나로 합쳐 전송합니다.
+
+    채널에 첫 경고가 들어오면 해당 채널의 전송 태스크를 만들고, 대기 시간 동안
+    큐에 쌓인 경고를 모두 꺼낸 뒤 한 번에 전송합니다.
+    """
+
+    _window: float
+    _queues: dict[int, "asyncio.Queue[str]"]
+    _tasks: set["asyncio.Task[None]"]
+    _closed: bool
+
+    def __init__(self, window: float = 0.3) -> None:
+        self._window = window
+        self._queues = {}
+        self._tasks = set()
+        self._closed = False
 
+    def put(self, channel: Messageable, text: str) -> None:
+        """전송할 경고 메시지를 채널의 큐에 추가합니다.
 
-class DeletionRepo:
-    @staticmethod
-    def get_all() -> ReaderIOResult[list[Deletion], None, _DbConnection]:
-        def func(conn: _DbConnection) -> IOResult[list[Deletion], None]:
-            logger.debug(conn)
-            return IOSuccess.from_value(_repo)
+        close()가 호출된 뒤에는 이미 모으고 있는 채널의 큐에만 추가하고, 새 전송
+        태스크는 만들지 않습니다.
 
-        return ReaderIOResult(func)
+        Args:
+            channel (Messageable): 경고 메시지를 전송할 채널
+            text (str): 경고 메시지
+        """
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            if self._closed:
+                logger.debug("Dropped reply deletion alert after close")
+                return
+            queue = self._queues[channel.id] = asyncio.Queue()
+            task = asyncio.create_task(self._flush(channel, queue))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        queue.put_nowait(text)
+
+    async def close(self) -> None:
+        """대기 중인 경고 메시지가 모두 전송될 때까지 기다립니다."""
+        self._closed = True
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _flush(self, channel: Messageable, queue: "asyncio.Queue[str]") -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window
+        texts = [await queue.get()]
+        try:
+            while (timeout := deadline - loop.time()) > 0:
+                texts.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+        except asyncio.TimeoutError:
+            pass
+        while not queue.empty():
+            texts.append(queue.get_nowait())
+        del self._queues[channel.id]
+
+        content = "\n".join(dict.fromkeys(texts))
+        if len(texts) > 1:
+            content = f"답장 메시지 {len(texts)}개를 삭제했어요.\n{content}"
+        try:
+            await channel.send(content)
+        except Exception:
+            logger.exception("Failed to send reply deletion alert")
 
 
-_MessageHandler = Callable[[Message], ReaderFutureResult[None, Any, _DbConnection]]
+@dataclass(frozen=True)
+class _MessageHandler:
+    should_handle: Callable[[Message], bool]
+    handle: Callable[[Message], Awaitable[None]]
 
 
-def delete_reply(
-    message: Message,
-) -> ReaderFutureResult[None, None, _DbConnection]:
-    """전달된 메시지가 답장 기능을 사용하였을 경우 삭제한 후 경고 메시지를
-    전송합니다.
+def is_reply(message: Message) -> bool:
+    """전달된 메시지가 답장 기능을 사용하였는지 확인합니다.
 
     Args:
         message (Message): 주입받은 메시지 객체
     """
+    return message.type is MessageType.reply
 
-    def func(dep: _DbConnection) -> FutureResult[None, None]:
-        deletions: IO[list[Deletion]] = DeletionRepo.get_all()(dep).value_or([])
-        m: Maybe[Message] = _validate_if_message_type_is_reply(message).bind(
-            _validate_if_message_is_from_deletions(deletions)
-        )
-        return FutureResult.from_result(maybe_to_result(m)).bind_awaitable(
-            _delete_message_and_send_alert(deletions)
-        )
 
-    return ReaderFutureResult(func)
-
-
-def _validate_if_message_type_is_reply(message: Message) -> Maybe[Message]:
-    match message.type:
-        case MessageType.reply:
-            logger.info(
-                f"{message.author.name}@{message.channel.name}: {message.content}"
-            )
-            return Some(message)
-        case _:
-            return Nothing
-
-
-def _validate_if_message_is_from_deletions(deletions: IO[list[Deletion]]):
-    def func(message: Message) -> Maybe[Message]:
-        result: IO[Deletion | None] = deletions.map(
-            lambda c: filter(lambda x: x.server_id == message.guild.id, c)
-        ).map(lambda filtered_deletions: next(filtered_deletions, None))
-        if result:
-            return Some(message)
-        else:
-            return Nothing
-
-    return func
-
-
-def _delete_message_and_send_alert(deletions: IO[list[Deletion]]):
-    async def func(message: Maybe[Message]):
-        deletion: IO[Deletion] = deletions.map(
-            lambda l: filter(lambda x: x.server_id == message.guild.id, l)
-        ).map(lambda l: next(l))
-        await message.delete()
-        return await (
-            Future.from_io(deletion)
-            .bind_awaitable(lambda x: message.channel.send(x.template_message))
-            .awaitable()
+async def delete_reply(message: Message, *, alert_batcher: AlertBatcher) -> None:
+    """답장 기능을 사용한 메시지를 삭제한 후 경고 메시지를 전송합니다.
+
+    Args:
+        message (Message): 주입받은 메시지 객체
+        alert_batcher (AlertBatcher): 경고 메시지를 모아 전송할 객체
+    """
+    if message.type is not MessageType.reply or message.guild is None:
+        return
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "%s@%s: %s", message.author.name, message.channel.name, message.content
         )
+    deletion: Deletion | None = _deletions_by_guild.get(message.guild.id)
+    if deletion is None:
+        return
+    text: str | None = deletion.template_message
+    await message.delete()
+    if text is not None:
+        alert_batcher.put(message.channel, text)
+
 
-    return func
+def reply_deletion(alert_batcher: AlertBatcher) -> _MessageHandler:
+    """답장 메시지를 삭제하는 메시지 핸들러를 생성합니다.
+
+    Args:
+        alert_batcher (AlertBatcher): 경고 메시지를 모아 전송할 객체
+    """
+    return _MessageHandler(
+        should_handle=is_reply,
+        handle=partial(delete_reply, alert_batcher=alert_batcher),
+    )
 
 
 MessageHandlerList = Block[_MessageHandler]
 
 
-@dataclass(frozen=True)
-class Test:
-    session: str
+def _compile_dispatch(
+    handlers: tuple[_MessageHandler, ...]
+) -> Callable[[Message], Awaitable[None]]:
+    """고정된 메시지 핸들러 목록을 메시지 하나를 처리하는 함수로 변환합니다.
+
+    Args:
+        handlers (tuple[_MessageHandler, ...]): 실행할 메시지 핸들러 목록
+    """
+    if len(handlers) == 1:
+        should_handle, handle = handlers[0].should_handle, handlers[0].handle
+
+        async def dispatch_single(message: Message) -> None:
+            if should_handle(message):
+                await handle(message)
+
+        return dispatch_single
+
+    async def dispatch(message: Message) -> None:
+        pending = [
+            handler.handle(message)
+            for handler in handlers
+            if handler.should_handle(message)
+        ]
+        if len(pending) == 1:
+            await pending[0]
+        elif pending:
+            await asyncio.gather(*pending)
+
+    return dispatch
 
 
 class MyDiscordClient(Client):
     """디스코드 봇 클라이언트 클래스입니다."""
 
     _discord_token: str
-    _message_handler_list: MessageHandlerList
+    _message_dispatch: Callable[[Message], Awaitable[None]]
+    _alert_batcher: AlertBatcher
 
     def __init__(
         self,
         env: MyDiscordClientEnvironment,
         message_handler_list: MessageHandlerList,
+        alert_batcher: AlertBatcher,
         *,
         intents: Intents,
         **options: Any,
     ) -> None:
         super().__init__(intents=intents, **options)
         self._discord_token = env.discord_token
-        self._message_handler_list = message_handler_list
+        self._message_dispatch = _compile_dispatch(tuple(message_handler_list))
+        self._alert_batcher = alert_batcher
 
     def run(
         self,
@@ -158,6 +223,11 @@ class MyDiscordClient(Client):
             root_logger=root_logger,
         )
 
+    async def close(self) -> None:
+        """대기 중인 경고 메시지를 모두 전송한 후 연결을 종료합니다."""
+        await self._alert_batcher.close()
+        await super().close()
+
     async def on_message(self, message: Message) -> None:
         """메시지 전송 이벤트가 발생할 시, 메시지 이벤트 핸들러들을 처리합니다.
 
@@ -167,18 +237,28 @@ class MyDiscordClient(Client):
         Args:
             message (Message): 주입받은 메시지 객체
         """
-        await asyncio.gather(
-            *(
-                handler(message=message)(Test(session="test")).awaitable()
-                for handler in self._message_handler_list
-            )
-        )
+        guild = message.guild
+        if guild is None or guild.id not in _target_guild_ids:
+            return
+        await self._message_dispatch(message)
 
 
 def bootstrap() -> Container:
     container = Container()
-    container[Intents] = Intents.default() | Intents(message_content=True)
-    container[MyDiscordClientEnvironment] = Singleton(MyDiscordClientEnvironment)
-    container[MessageHandlerList] = Block.empty().cons(delete_reply)
-    container[MyDiscordClient] = Singleton(MyDiscordClient)
+    env = MyDiscordClientEnvironment()
+    if not env.discord_token:
+        raise ValueError("DISCORD_TOKEN 환경 변수가 비어 있습니다.")
+    alert_batcher = AlertBatcher()
+    message_handler_list: MessageHandlerList = Block.empty().cons(
+        reply_deletion(alert_batcher)
+    )
+    container[MyDiscordClientEnvironment] = env
+    container[AlertBatcher] = alert_batcher
+    container[MessageHandlerList] = message_handler_list
+    container[MyDiscordClient] = MyDiscordClient(
+        env=env,
+        message_handler_list=message_handler_list,
+        alert_batcher=alert_batcher,
+        intents=Intents.default() | Intents(message_content=True),
+    )
     return container